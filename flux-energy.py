@@ -1,9 +1,7 @@
 import argparse
 import typing
 
-import matplotlib.pyplot as plt
-
-from eprempy.paths import fullpath
+from eprempy import eprem
 from support import interfaces
 from support import plots
 
@@ -14,23 +12,27 @@ def main(
     config: typing.Optional[str]=None,
     outdir: typing.Optional[str]=None,
     verbose: bool=False,
+    jobs: int=1,
     **user
 ) -> None:
     """Create survey plots for one or more stream observers."""
-    streams = interfaces.get_streams(source, config, num)
-    plotdir = fullpath(outdir or source or '.')
-    plotdir.mkdir(parents=True, exist_ok=True)
-    for stream in streams:
-        fig = plt.figure(figsize=(6, 6), layout='constrained')
-        ax = fig.gca()
-        plots.flux_energy(stream, user, axes=ax)
-        plotpath = plotdir / stream.source.with_suffix('.png').name
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
+    plots.save_observers(
+        plot_stream,
+        user,
+        num=num,
+        source=source,
+        config=config,
+        outdir=outdir,
+        verbose=verbose,
+        jobs=jobs,
+        subplots={'figsize': (6, 6), 'layout': 'constrained'},
+        rc=plots.get_rcparams(user),
+    )
+
+
+def plot_stream(stream: eprem.Stream, user: dict, fig) -> None:
+    """Draw flux versus energy for this stream on `fig`."""
+    plots.flux_energy(stream, user, axes=fig.gca())
 
 
 epilog = """
@@ -1,8 +1,7 @@
 import argparse
 import typing
 
-import matplotlib.pyplot as plt
-
+from eprempy import eprem
 from eprempy.paths import fullpath
 from support import interfaces
 from support import plots
@@ -14,25 +13,32 @@ def main(
     config: typing.Optional[str]=None,
     outdir: typing.Optional[str]=None,
     verbose: bool=False,
+    jobs: int=1,
     **user
 ) -> None:
     """Create survey plots for one or more stream observers."""
-    streams = interfaces.get_streams(source, config, num)
-    plotdir = fullpath(outdir or source or '.')
-    plotdir.mkdir(parents=True, exist_ok=True)
-    for stream in streams:
-        fig = plt.figure(figsize=(6, 6), layout='constrained')
-        ax = fig.gca()
-        plots.intflux_time(stream, user)
-        title = plots.make_title(stream, user, ['location', 'species'])
-        ax.set_title(title, fontsize=20)
-        plotpath = plotdir / stream.source.with_suffix('.png').name
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
+    if user.get('cache'):
+        user['cachedir'] = fullpath(outdir or source or '.') / '.cache'
+    plots.save_observers(
+        plot_stream,
+        user,
+        num=num,
+        source=source,
+        config=config,
+        outdir=outdir,
+        verbose=verbose,
+        jobs=jobs,
+        subplots={'figsize': (6, 6), 'layout': 'constrained'},
+        rc=plots.get_rcparams(user),
+    )
+
+
+def plot_stream(stream: eprem.Stream, user: dict, fig) -> None:
+    """Draw integral flux versus time for this stream on `fig`."""
+    ax = fig.gca()
+    plots.intflux_time(stream, user, axes=ax, cachedir=user.get('cachedir'))
+    title = plots.make_title(stream, user, ['location', 'species'])
+    ax.set_title(title, fontsize=20)
 
 
 epilog = """
@@ -62,5 +68,10 @@ if __name__ == '__main__':
         '--time-unit',
         help="metric unit in which to display times",
     )
+    parser.add_argument(
+        '--cache',
+        help="reuse integral-flux arrays saved by previous runs",
+        action='store_true',
+    )
     args = parser.parse_args()
     main(**vars(args))
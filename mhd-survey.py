@@ -1,13 +1,14 @@
 import argparse
 import typing
 
-import matplotlib.pyplot as plt
+import numpy
 from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
 
 from eprempy import eprem
-from eprempy import quantity
-from eprempy.paths import fullpath
+from eprempy import metric
 from support import interfaces
+from support import plots
 
 
 def main(
@@ -16,30 +17,23 @@ def main(
     config: str=None,
     outdir: str=None,
     verbose: bool=False,
+    jobs: int=1,
     **user
 ) -> None:
     """Plot a survey of MHD quantities for a given stream observer."""
-    streams = interfaces.get_streams(source, config, num)
-    plotdir = fullpath(outdir or source or '.')
-    plotdir.mkdir(parents=True, exist_ok=True)
-    for stream in streams:
-        plot_stream(stream, user)
-        plotname = f"mhd-{stream.source.stem}.png"
-        plotpath = plotdir / plotname
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
-
-
-def get_streams(dataset: eprem.Dataset, num: typing.Optional[int]=None):
-    """Get all relevant stream observers."""
-    streams = dataset.streams
-    if isinstance(num, int):
-        return [streams[num]]
-    return list(streams.values())
+    plots.save_observers(
+        plot_stream,
+        user,
+        num=num,
+        source=source,
+        config=config,
+        outdir=outdir,
+        verbose=verbose,
+        jobs=jobs,
+        plotname='mhd-{stem}.png',
+        subplots={'nrows': 3, 'ncols': 1, 'sharex': True},
+        clear=False,
+    )
 
 
 def get_ylims(user: dict):
@@ -52,42 +46,138 @@ def get_ylims(user: dict):
 
 
 SUBSETS = {
-    'B':   {'unit': 'nT',     'type': 'vector'},
-    'U':   {'unit': 'cm / s', 'type': 'vector'},
-    'rho': {'unit': 'cm^-3',  'type': 'scalar'},
+    'B':   {'unit': metric.unit('nT'),     'type': 'vector'},
+    'U':   {'unit': metric.unit('cm / s'), 'type': 'vector'},
+    'rho': {'unit': metric.unit('cm^-3'),  'type': 'scalar'},
 }
+"""Plotted subsets of MHD quantities, with units parsed at import."""
 
 
-def plot_stream(stream: eprem.Stream, user: dict) -> None:
-    """Create a survey plot for this stream."""
-    fig, axs = plt.subplots(
-        nrows=3,
-        ncols=1,
-        sharex=True,
-    )
+def get_xaxis(user: dict) -> str:
+    """Determine whether to plot quantities versus time or radius."""
     # NOTE: Either time or location could be 0, so we can't rely on `if time and
     # not location` or `if location and not time`.
     if user['time'] is None and user['location'] is not None:
-        f = plot_at_location
-        c = interfaces.get_locations(user)
-        u = 'hour'
-    elif user['location'] is None and user['time'] is not None:
-        f = plot_at_time
-        c = interfaces.get_times(user)
-        u = 'au'
-    else:
-        raise ValueError(
-            f"One of either time or location must be None"
-        ) from None
+        return 'time'
+    if user['location'] is None and user['time'] is not None:
+        return 'radius'
+    raise ValueError(
+        f"One of either time or location must be None"
+    ) from None
+
+
+XLABELS = {
+    'time': "Time [hour]",
+    'radius': "Radius [au]",
+}
+
+
+def count_values(user: dict) -> int:
+    """Count the values of the parameter that is not on the x axis."""
+    if get_xaxis(user) == 'time':
+        return len(interfaces.get_locations(user))
+    return len(interfaces.get_times(user))
+
+
+def create_lines(
+    axs: typing.Sequence[Axes],
+    user: dict,
+) -> typing.Dict[str, typing.List[Line2D]]:
+    """Format the survey axes and create empty lines for each quantity.
+
+    This function applies all formatting that does not depend on a particular
+    stream, so that callers can plot a series of streams by updating the data
+    of the returned lines (cf. `plot_stream`). It creates one line per value of
+    the multi-valued parameter (cf. `count_values`) for each quantity.
+    """
+    xlabel = XLABELS[get_xaxis(user)]
     ylog = user.get('ylog')
     ylims = get_ylims(user)
     if ylog == []:
         ylog = list(SUBSETS)
     elif ylog is None:
         ylog = []
-    for i, key in enumerate(('B', 'U', 'rho')):
-        yscale = 'log' if key in ylog else 'linear'
-        f(axs[i], key, stream, c, u, yscale, user['xlim'], ylims[key])
+    nvalues = count_values(user)
+    lines = {}
+    for ax, key in zip(axs, ('B', 'U', 'rho')):
+        lines[key] = [
+            ax.plot([], [], label=LABELS[name])[0]
+            for name in get_quantities(key)
+            for _ in range(nvalues)
+        ]
+        ax.set_xlabel(xlabel, fontsize=14)
+        ax.set_ylabel(f"[{SUBSETS[key]['unit'].format('tex')}]")
+        ax.set_yscale('log' if key in ylog else 'linear')
+        if user['xlim'] is not None:
+            ax.set_xlim(user['xlim'])
+        if ylims[key] is not None:
+            ax.set_ylim(ylims[key])
+        ax.legend()
+        ax.label_outer()
+    return lines
+
+
+def plot_stream(stream: eprem.Stream, user: dict, fig) -> None:
+    """Draw the MHD survey for this stream on `fig`.
+
+    This function formats the axes and creates the survey lines the first time
+    it draws on `fig` (cf. `create_lines`), and afterwards only updates the data
+    of those lines.
+    """
+    if not fig.axes[0].get_lines():
+        create_lines(fig.axes, user)
+    x, arrays = read_arrays(stream, user)
+    for ax, key in zip(fig.axes, SUBSETS):
+        rows = [
+            (xrow, yrow)
+            for component in arrays[key]
+            for xrow, yrow in zip(x, component)
+        ]
+        for line, (xrow, yrow) in zip(ax.get_lines(), rows):
+            line.set_data(xrow, yrow)
+        ax.relim()
+        ax.autoscale_view()
+
+
+def get_quantities(key: str) -> typing.List[str]:
+    """Get the names of the quantities in the named subset."""
+    if SUBSETS[key]['type'] == 'vector':
+        return [f"{key}{c}" for c in ('r', 'theta', 'phi')]
+    return [key]
+
+
+def read_arrays(
+    stream: eprem.Stream,
+    user: dict,
+) -> typing.Tuple[numpy.ndarray, typing.Dict[str, numpy.ndarray]]:
+    """Read the x-axis values and every plotted quantity into plain arrays.
+
+    This function reads each quantity from the dataset exactly once per stream,
+    converting it to the unit of its subset, so that plotting routines can work
+    with in-memory arrays. The x-axis array has one row per value of the
+    multi-valued parameter (cf. `count_values`). The result maps each subset key
+    to an array with one such block of rows per component (e.g., a 3-by-M-by-N
+    array for a vector subset with M values).
+    """
+    nvalues = count_values(user)
+    if get_xaxis(user) == 'time':
+        indices = (slice(None), interfaces.get_locations(user))
+        times = numpy.array(stream.times.withunit('hour'))
+        x = numpy.broadcast_to(times, (nvalues, len(times)))
+    else:
+        indices = (interfaces.get_times(user), slice(None))
+        radii = stream['radius'].withunit('au')[indices].squeezed
+        x = numpy.reshape(radii, (nvalues, -1))
+    arrays = {}
+    for key, subset in SUBSETS.items():
+        components = []
+        for name in get_quantities(key):
+            y = stream[name].withunit(subset['unit'])[indices].squeezed
+            if get_xaxis(user) == 'time':
+                y = numpy.transpose(numpy.reshape(y, (-1, nvalues)))
+            components.append(numpy.reshape(y, x.shape))
+        arrays[key] = numpy.stack(components)
+    return x, arrays
 
 
 LABELS = {
@@ -101,86 +191,6 @@ LABELS = {
 }
 
 
-def plot_at_time(
-    ax: Axes,
-    key: str,
-    stream: eprem.Stream,
-    time: typing.Union[int, quantity.Measurement],
-    unit: str,
-    yscale: str,
-    xlim: tuple,
-    ylim: tuple,
-) -> None:
-    """Plot the given quantities at the given time."""
-    indices = (time, slice(None))
-    plot_quantities(
-        ax,
-        key,
-        stream['radius'][indices].withunit(unit).squeezed,
-        stream,
-        indices,
-        f"Radius [{unit}]",
-        yscale,
-        xlim,
-        ylim,
-    )
-
-
-def plot_at_location(
-    ax: Axes,
-    key: str,
-    stream: eprem.Stream,
-    location: typing.Union[int, quantity.Measurement],
-    unit: str,
-    yscale: str,
-    xlim: tuple,
-    ylim: tuple,
-) -> None:
-    """Plot the named quantities at the given location."""
-    plot_quantities(
-        ax,
-        key,
-        stream.times.withunit(unit),
-        stream,
-        (slice(None), location),
-        f"Time [{unit}]",
-        yscale,
-        xlim,
-        ylim,
-    )
-
-
-def plot_quantities(
-    ax: Axes,
-    key: str,
-    x,
-    stream: eprem.Stream,
-    indices: tuple,
-    xlabel: str,
-    yscale: str,
-    xlim: tuple,
-    ylim: tuple,
-) -> None:
-    """Common plotting logic."""
-    subset = SUBSETS[key]
-    if subset['type'] == 'vector':
-        quantities = [f"{key}{c}" for c in ('r', 'theta', 'phi')]
-    else:
-        quantities = [key]
-    for quantity in quantities:
-        y = stream[quantity][indices].withunit(subset['unit'])
-        ax.plot(x, y.squeezed, label=LABELS[quantity])
-    ax.set_xlabel(xlabel, fontsize=14)
-    ax.set_ylabel(f"[{y.unit.format('tex')}]")
-    ax.set_yscale(yscale)
-    if xlim is not None:
-        ax.set_xlim(xlim)
-    if ylim is not None:
-        ax.set_ylim(ylim)
-    ax.legend()
-    ax.label_outer()
-
-
 epilog = """
 Notes on time and location:
     * You may provide a single value for both parameters, or a single value for
@@ -263,6 +273,12 @@ if __name__ == '__main__':
         type=float,
         metavar=("LO", 'HI'),
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        help="number of streams to plot in parallel (default: 1)",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         '-v', '--verbose',
         help="print runtime messages",
@@ -1,4 +1,5 @@
 import argparse
+import math
 import re
 import typing
 import sys
@@ -11,11 +12,12 @@ import numpy.typing
 from scipy import signal
 
 from eprempy import atomic
-from eprempy import container
 from eprempy import eprem
 from eprempy import Observable
 from eprempy import paths
 from eprempy import physical
+from support import interfaces
+from support import plots
 
 
 def main(
@@ -33,8 +35,10 @@ def main(
     xfontsize: float,
     yticksize: float,
     yfontsize: float,
+    dpi: float=100,
 ) -> None:
     """Plot node histories."""
+    interfaces.set_backend()
     stream = eprem.stream(n, source=source)
     if not quantities:
         raise ValueError("Nothing to plot") from None
@@ -49,7 +53,7 @@ def main(
     plt.xticks(fontsize=xticksize)
     suptitle = create_suptitle(stream, step, shell, species, energy)
     plt.suptitle(suptitle, fontsize=20)
-    for quantity in container.unique(quantities):
+    for quantity in dict.fromkeys(quantities):
         ax = axd[quantity]
         if quantity.lower() == 'dqdt':
             plot_dqdt_history(
@@ -88,7 +92,7 @@ def main(
     savepath = savedir / savename
     if verbose:
         print(f"Saving {savepath}")
-    plt.savefig(savepath)
+    plt.savefig(savepath, **{**plots.SAVEFIG_KWS, 'dpi': dpi})
     plt.close()
 
 
@@ -203,15 +207,19 @@ def plot_dqdt_history(
     (FTE) as functions of time. In the co-moving reference frame, FTE
     acceleration terms all have the form dQ/dt.
     """
+    histories = {
+        name: compute_history(stream[name], step, shell, species, energy)
+        for name in FTE_QUANTITIES
+    }
+    spacing = compute_spacing(numpy.array(times.withunit('s')))
+    speed = compute_speed(species, energy)
     for (filter, linestyle) in zip((False, True), ('dotted', 'solid')):
         plot_fte_dqdt(
             ax=ax,
-            stream=stream,
+            histories=histories,
             times=times,
-            step=step,
-            shell=shell,
-            species=species,
-            energy=energy,
+            spacing=spacing,
+            speed=speed,
             filter=filter,
             linestyle=linestyle,
         )
@@ -231,48 +239,78 @@ def plot_dqdt_history(
     ax.ticklabel_format(axis='y', scilimits=(0, 0))
 
 
+FTE_QUANTITIES = ('rho', 'br', 'btheta', 'bphi', 'ur', 'utheta', 'uphi')
+"""Node-history quantities needed to compute FTE acceleration terms."""
+
+
+FTE_COLORS = ('C0', 'C1', 'C2', 'C3')
+"""Line colors for FTE acceleration terms, in plotting order."""
+
+
+def compute_spacing(
+    t: numpy.typing.NDArray,
+) -> typing.Union[float, numpy.typing.NDArray]:
+    """Compute the spacing of `t` for use with `numpy.gradient`.
+
+    This function returns the constant step size if `t` is uniformly spaced,
+    which lets `numpy.gradient` use its simpler uniform-spacing formula, and
+    returns `t` otherwise.
+    """
+    dt = numpy.diff(t)
+    if dt.size > 0 and numpy.allclose(dt, dt[0]):
+        return float(dt[0])
+    return t
+
+
+def compute_speed(species: str, energy: float) -> float:
+    """Compute the speed in cm/s of a particle with `energy` in MeV."""
+    e = physical.scalar(energy, unit='MeV')
+    m = atomic.species(species).mass.withunit('g')
+    return math.sqrt(2 * float(e.withunit('erg')) / float(m))
+
+
 def plot_fte_dqdt(
     ax: Axes,
-    stream: eprem.Stream,
+    histories: typing.Dict[str, numpy.typing.NDArray],
     times: physical.Array,
-    step: int,
-    shell: int,
-    species: str,
-    energy: float,
+    spacing: typing.Union[float, numpy.typing.NDArray],
+    speed: float,
     filter: bool,
     **kwargs
 ) -> None:
-    """Compute and plot FTE acceleration terms as functions of time."""
-    rho = compute_history(stream['rho'], step, shell, species, energy)
-    br = compute_history(stream['br'], step, shell, species, energy)
-    btheta = compute_history(stream['btheta'], step, shell, species, energy)
-    bphi = compute_history(stream['bphi'], step, shell, species, energy)
-    ur = compute_history(stream['ur'], step, shell, species, energy)
-    utheta = compute_history(stream['utheta'], step, shell, species, energy)
-    uphi = compute_history(stream['uphi'], step, shell, species, energy)
-    s = atomic.species(species)
-    e = physical.scalar(energy, unit='MeV')
-    v = numpy.sqrt(2 * e.withunit('erg') / s.mass.withunit('g')) # -> cm/s
-    t = numpy.array(times.withunit('s'))
-    bmag = numpy.sqrt(br**2 + btheta**2 + bphi**2)
+    """Compute and plot FTE acceleration terms as functions of time.
+
+    The `histories` argument must map each name in `FTE_QUANTITIES` to its
+    node history (cf. `compute_history`), so that callers can read each
+    quantity once and plot both raw and smoothed terms. The `spacing` argument
+    must be the time spacing in seconds, for computing derivatives (cf.
+    `compute_spacing`), and `speed` must be the particle speed in cm/s (cf.
+    `compute_speed`).
+    """
+    rho = histories['rho']
+    b = numpy.stack((histories['br'], histories['btheta'], histories['bphi']))
+    u = numpy.stack((histories['ur'], histories['utheta'], histories['uphi']))
+    # NOTE: Each einsum computes a component-wise dot product in one pass,
+    # without allocating a temporary array for every product and partial sum.
+    bmag = numpy.sqrt(numpy.einsum('ij,ij->j', b, b))
     if filter:
         rho = smooth(rho)
         bmag = smooth(bmag)
-    rho_b = rho / bmag
-    dln_n_dt = numpy.gradient(numpy.log(rho), t)
-    dln_n_b_dt = numpy.gradient(numpy.log(rho_b), t)
-    dln_b_dt = numpy.gradient(numpy.log(bmag), t)
-    ub = (br*ur + btheta*utheta + bphi*uphi) / bmag
-    dub_dt = numpy.gradient(ub, t)
+    ub = numpy.einsum('ij,ij->j', b, u) / bmag
+    # NOTE: Since ln(n/B) = ln(n) - ln(B) and the gradient is linear, we can
+    # differentiate every term with one call and derive d[ln(n/B)]/dt.
+    stacked = numpy.stack((rho, bmag, ub))
+    numpy.log(stacked[:2], out=stacked[:2])
+    dln_n_dt, dln_b_dt, dub_dt = numpy.gradient(stacked, spacing, axis=1)
+    dln_n_b_dt = dln_n_dt - dln_b_dt
     smstr = ' [smoothed]' if filter else ''
-    quantities = {
-        rf'$\ln({{n/B}})${smstr}': dln_n_b_dt,
-        rf'$\ln({{B}})${smstr}': dln_b_dt,
-        rf'$\ln({{n}})${smstr}': dln_n_dt,
-        rf'$-\hat{{b}}\cdot\vec{{V}}/w${smstr}': -dub_dt / v,
-    }
-    colors = [f'C{i}' for i in range(len(quantities))]
-    for color, (label, array) in zip(colors, quantities.items()):
+    quantities = (
+        (rf'$\ln({{n/B}})${smstr}', dln_n_b_dt),
+        (rf'$\ln({{B}})${smstr}', dln_b_dt),
+        (rf'$\ln({{n}})${smstr}', dln_n_dt),
+        (rf'$-\hat{{b}}\cdot\vec{{V}}/w${smstr}', -dub_dt / speed),
+    )
+    for color, (label, array) in zip(FTE_COLORS, quantities):
         ax.plot(
             times,
             array,
@@ -295,16 +333,18 @@ def compute_history(
         indices.append(species)
     if any(s in observable.dimensions for s in ('energy', 'minimum energy')):
         indices.append((energy, 'MeV'))
-    array = observable[*tuple(indices)]
-    ntimes = array.shape[0]
-    ts = zip(range(step, step+ntimes), range(shell, shell+ntimes))
-    return numpy.squeeze([array[t-step, s-step, ...] for t, s in ts])
+    array = numpy.array(observable[*tuple(indices)], dtype=float)
+    # NOTE: The node moves out one shell per time step, so its history lies
+    # along a diagonal of the (time, shell) plane.
+    t = numpy.arange(array.shape[0])
+    history = array[t, t + shell - step, ...]
+    return numpy.squeeze(history)
 
 
 def smooth(x) -> numpy.typing.NDArray:
     """Smooth x and set negative values to a small positive value."""
     xs = signal.savgol_filter(x, 11, 2)
-    return numpy.where(xs > 0, xs, sys.float_info.min)
+    return numpy.fmax(xs, sys.float_info.min, out=xs)
 
 
 epilog = \
@@ -414,6 +454,12 @@ if __name__ == '__main__':
         type=float,
         default=16,
     )
+    p.add_argument(
+        '--dpi',
+        help="resolution of the saved plot (default: 100; try 72 for drafts)",
+        type=float,
+        default=100,
+    )
     p.add_argument(
         '-v', '--verbose',
         help="print runtime messages",
@@ -1,13 +1,13 @@
 import argparse
+import math
 import typing
 
 import numpy
-import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 
 from eprempy import eprem
 from eprempy import quantity
-from eprempy.paths import fullpath
+from support import plots
 
 
 def main(
@@ -16,58 +16,57 @@ def main(
     config: str=None,
     outdir: str=None,
     verbose: bool=False,
+    jobs: int=1,
     **user
 ) -> None:
     """Create survey plots for one or more point observers."""
-    source = indir or '.'
-    dataset = eprem.dataset(source=source, config=config)
-    points = get_points(dataset, num)
-    species = get_species(user)
-    plotdir = fullpath(outdir or source)
-    plotdir.mkdir(parents=True, exist_ok=True)
-    for point in points:
-        plot_point(point, species=species)
-        plotpath = plotdir / point.source.with_suffix('.png').name
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        plt.close()
-
-
-def plot_point(point: eprem.Observer, **kwargs):
-    """Create a survey plot for this point."""
-    fig, axs = plt.subplots(
-        nrows=1,
-        ncols=3,
-        squeeze=True,
-        figsize=(20, 6),
-        layout='constrained',
+    plots.save_observers(
+        plot_point,
+        user,
+        kind='point',
+        num=num,
+        source=indir or '.',
+        config=config,
+        outdir=outdir,
+        verbose=verbose,
+        jobs=jobs,
+        subplots={
+            'nrows': 1,
+            'ncols': 3,
+            'figsize': (20, 6),
+            'layout': 'constrained',
+        },
+        rc=plots.get_rcparams(user),
     )
-    plot_point_flux(axs[0], point, **kwargs)
-    plot_point_fluence(axs[1], point, **kwargs)
-    plot_point_intflux(axs[2], point, **kwargs)
-    fig.suptitle(make_suptitle(point, **kwargs), fontsize=20)
+
+
+def plot_point(point: eprem.Observer, user: dict, fig) -> None:
+    """Draw the survey panels for this point on `fig`."""
+    species = get_species(user)
+    axs = fig.axes
+    energies = point.energies.withunit('MeV')
+    plot_point_flux(axs[0], point, energies, species=species)
+    plot_point_fluence(axs[1], point, energies, species=species)
+    plot_point_intflux(axs[2], point, species=species)
+    fig.suptitle(make_suptitle(point, species=species), fontsize=20)
 
 
 def plot_point_flux(
     ax: Axes,
     point: eprem.Point,
+    energies: quantity.Measurement,
     species: typing.Union[int, str],
 ) -> None:
     """Create a plot of flux versus time for this point."""
     flux = point['flux'].withunit('1 / (cm^2 s sr MeV/nuc)')
-    energies = point.energies.withunit('MeV')
-    yvalmax = None
-    for i, energy in enumerate(energies):
-        array = flux[:, 0, species, i].squeezed
-        label = f"{float(energy):.3f} {energies.unit}"
-        ax.plot(point.times, array, label=label)
-        arraymax = numpy.max(array)
-        if yvalmax is None:
-            yvalmax = arraymax
-        else:
-            yvalmax = max(yvalmax, arraymax)
-    ylogmax = int(numpy.log10(yvalmax)) + 1
+    arrays = numpy.reshape(
+        flux[:, 0, species, :].squeezed,
+        (-1, len(energies)),
+    )
+    lines = ax.plot(numpy.array(point.times), arrays)
+    for line, energy in zip(lines, energies):
+        line.set_label(f"{float(energy):.3f} {energies.unit}")
+    ylogmax = int(math.log10(arrays.max())) + 1
     ax.set_ylim([10**(ylogmax-6), 10**ylogmax])
     ax.set_xlabel(f"Time [{point.times.unit}]", fontsize=14)
     ax.set_ylabel(r"Flux [1 / (cm$^2$ s sr MeV/nuc)]", fontsize=14)
@@ -79,14 +78,14 @@ def plot_point_flux(
 def plot_point_fluence(
     ax: Axes,
     point: eprem.Point,
+    energies: quantity.Measurement,
     species: typing.Union[int, str],
 ) -> None:
     """Create a plot of fluence versus energy for this point."""
     fluence = point['fluence'].withunit('1 / (cm^2 sr MeV/nuc)')
-    energies = point.energies.withunit('MeV')
     array = fluence[-1, 0, species, :].squeezed
-    ax.plot(energies, array)
-    ylogmax = int(numpy.log10(numpy.max(array))) + 1
+    ax.plot(numpy.array(energies), array)
+    ylogmax = int(math.log10(array.max())) + 1
     ax.set_ylim([10**(ylogmax-6), 10**ylogmax])
     ax.set_xlabel(f"Energy [{energies.unit}]", fontsize=14)
     ax.set_ylabel(r"Fluence [1 / (cm$^2$ sr MeV/nuc)]", fontsize=14)
@@ -94,6 +93,10 @@ def plot_point_fluence(
     ax.set_yscale('log')
 
 
+INTFLUX_ENERGIES = quantity.measure(1.0, 5.0, 10.0, 50.0, 100.0, 'MeV')
+"""Threshold energies at which to plot integral flux."""
+
+
 def plot_point_intflux(
     ax: Axes,
     point: eprem.Point,
@@ -101,18 +104,15 @@ def plot_point_intflux(
 ) -> None:
     """Create a plot of integral flux versus time for this point."""
     intflux = point['integral flux'].withunit('1 / (cm^2 s sr)')
-    energies = quantity.measure(1.0, 5.0, 10.0, 50.0, 100.0, 'MeV')
-    yvalmax = None
-    for energy in energies:
-        array = intflux[:, 0, species, energy].squeezed
-        label = f"{float(energy)} {energies.unit}"
-        ax.plot(point.times, array, label=label)
-        arraymax = numpy.max(array)
-        if yvalmax is None:
-            yvalmax = arraymax
-        else:
-            yvalmax = max(yvalmax, arraymax)
-    ylogmax = int(numpy.log10(yvalmax)) + 1
+    energies = INTFLUX_ENERGIES
+    arrays = numpy.reshape(
+        intflux[:, 0, species, energies].squeezed,
+        (-1, len(energies)),
+    )
+    lines = ax.plot(numpy.array(point.times), arrays)
+    for line, energy in zip(lines, energies):
+        line.set_label(f"{float(energy)} {energies.unit}")
+    ylogmax = int(math.log10(arrays.max())) + 1
     ax.set_ylim([10**(ylogmax-6), 10**ylogmax])
     ax.set_xlabel(f"Time [{point.times.unit}]", fontsize=14)
     ax.set_ylabel(r"Integral Flux [1 / (cm$^2$ s sr)]", fontsize=14)
@@ -121,14 +121,6 @@ def plot_point_intflux(
     ax.legend(loc='center left', bbox_to_anchor=(1.0, 0.5), handlelength=1.0)
 
 
-def get_points(dataset: eprem.Dataset, num: typing.Optional[int]=None):
-    """Get all relevant point observers."""
-    points = dataset.points
-    if isinstance(num, int):
-        return [points[num]]
-    return list(points.values())
-
-
 def make_suptitle(
     point: eprem.Point,
     species: typing.Union[int, str],
@@ -184,10 +176,24 @@ if __name__ == '__main__':
             "; may be symbol or index (default: 0)"
         ),
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        help="number of points to plot in parallel (default: 1)",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         '-v', '--verbose',
         help="print runtime messages",
         action='store_true',
     )
+    parser.add_argument(
+        '--simplify-threshold',
+        help=(
+            "maximum pixel deviation when simplifying plotted lines"
+            "; smaller values keep more detail (default: 1.0)"
+        ),
+        type=float,
+    )
     args = parser.parse_args()
     main(**vars(args))
@@ -1,12 +1,12 @@
 import argparse
 import typing
 
-import matplotlib.pyplot as plt
+import numpy
 
 from eprempy import eprem
 from eprempy import quantity
-from eprempy.paths import fullpath
 from support import interfaces
+from support import plots
 
 
 def main(
@@ -15,29 +15,26 @@ def main(
     config: typing.Optional[str]=None,
     outdir: typing.Optional[str]=None,
     verbose: bool=False,
+    jobs: int=1,
     **user
 ) -> None:
     """Plot flux versus energy on a given stream."""
-    streams = interfaces.get_streams(source, config, num)
-    plotdir = fullpath(outdir or source or '.')
-    plotdir.mkdir(parents=True, exist_ok=True)
-    for stream in streams:
-        stream_flux(stream, user)
-        plotname = f"{stream.source.stem}-flux-energy.png"
-        plotpath = plotdir / plotname
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
+    plots.save_observers(
+        plot_stream,
+        user,
+        num=num,
+        source=source,
+        config=config,
+        outdir=outdir,
+        verbose=verbose,
+        jobs=jobs,
+        plotname='{stem}-flux-energy.png',
+    )
 
 
-def stream_flux(
-    stream: eprem.Stream,
-    user: dict,
-) -> None:
-    """Plot the flux on a given stream."""
+def plot_stream(stream: eprem.Stream, user: dict, fig) -> None:
+    """Draw the flux on a given stream on `fig`."""
+    ax = fig.gca()
     times = interfaces.get_times(user)
     locations = interfaces.get_locations(user)
     ntimes = len(times)
@@ -45,40 +42,46 @@ def stream_flux(
     units = {k: user.get(f'{k}_unit') or u for k, u in interfaces.UNITS.items()}
     flux = stream['flux'].withunit(units['flux'])
     species = interfaces.get_species(user)
-    arrays = flux[times, locations, species, :].squeezed
     energies = stream.energies.withunit(units['energy'])
+    arrays = numpy.reshape(
+        flux[times, locations, species, :].squeezed,
+        (-1, len(energies)),
+    )
     if ntimes == 1 and nlocations == 1:
-        plt.plot(energies, arrays[0])
+        labels = []
     elif ntimes > 1 and nlocations == 1:
-        for time, array in zip(times, arrays):
-            if isinstance(times, quantity.Measurement):
-                label = f"t = {float(time)} {times.unit}"
-            else:
-                label = f"t = {time}"
-            plt.plot(energies, array, label=label)
+        if isinstance(times, quantity.Measurement):
+            labels = [f"t = {float(time)} {times.unit}" for time in times]
+        else:
+            labels = [f"t = {time}" for time in times]
     elif nlocations > 1 and ntimes == 1:
-        for location, array in zip(locations, arrays):
-            if isinstance(locations, quantity.Measurement):
-                label = f"r = {float(location)} {locations.unit}"
-            else:
-                label = f"s = {location}"
-            plt.plot(energies, array, label=label)
+        if isinstance(locations, quantity.Measurement):
+            labels = [
+                f"r = {float(location)} {locations.unit}"
+                for location in locations
+            ]
+        else:
+            labels = [f"s = {location}" for location in locations]
     else:
         raise ValueError(
             "Either time or location, but not both, may be multi-valued"
         ) from None
+    xvalues = numpy.array(energies)
+    lines = ax.plot(xvalues, numpy.transpose(arrays))
+    for line, label in zip(lines, labels):
+        line.set_label(label)
     if user.get('show_initial'):
         initial = flux[0, 0, species, :].squeezed
-        plt.plot(energies, initial, 'k--', label='Seed Spectrum')
-    plt.legend()
-    plt.xscale('log')
-    plt.yscale('log')
-    plt.xlabel(f'Energy [{units["energy"]}]')
-    plt.ylabel(f'Flux [{units["flux"]}]')
+        ax.plot(xvalues, initial, 'k--', label='Seed Spectrum')
+    ax.legend()
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel(f'Energy [{units["energy"]}]')
+    ax.set_ylabel(f'Flux [{units["flux"]}]')
     if xlim := user.get('xlim'):
-        plt.xlim(xlim)
+        ax.set_xlim(xlim)
     if ylim := user.get('ylim'):
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
 
 
 epilog = """
@@ -161,6 +164,12 @@ if __name__ == '__main__':
         help="include the initial spectrum at the solar surface.",
         action='store_true',
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        help="number of streams to plot in parallel (default: 1)",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         '-v', '--verbose',
         help="print runtime messages",
@@ -1,11 +1,7 @@
 import argparse
 import typing
 
-import matplotlib.pyplot as plt
-
 from eprempy import eprem
-from eprempy.paths import fullpath
-from support import interfaces
 from support import plots
 
 
@@ -15,38 +11,40 @@ def main(
     config: typing.Optional[str]=None,
     outdir: typing.Optional[str]=None,
     verbose: bool=False,
+    jobs: int=1,
     **user
 ) -> None:
     """Create survey plots for one or more stream observers."""
-    streams = interfaces.get_streams(source, config, num)
-    plotdir = fullpath(outdir or source or '.')
-    plotdir.mkdir(parents=True, exist_ok=True)
-    for stream in streams:
-        plot_stream(stream, user)
-        plotpath = plotdir / stream.source.with_suffix('.png').name
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
+    plots.save_observers(
+        plot_stream,
+        user,
+        num=num,
+        source=source,
+        config=config,
+        outdir=outdir,
+        verbose=verbose,
+        jobs=jobs,
+        subplots=get_subplots_kws(user),
+        rc=plots.get_rcparams(user),
+    )
 
 
-def plot_stream(stream: eprem.Observer, user: dict):
-    """Create a survey plot for this stream."""
+def get_subplots_kws(user: dict) -> dict:
+    """Get arguments to `pyplot.subplots` for the requested panels."""
     panels = user.get('quantities') or ()
-    npanels = len(panels)
-    if npanels == 0:
-        return
     width = sum(v['width'] for k, v in PANELS.items() if k in panels)
-    fig, axs = plt.subplots(
-        nrows=1,
-        ncols=len(panels),
-        squeeze=True,
-        figsize=(width, 6),
-        layout='constrained',
-    )
-    for ax, k in zip((axs if npanels > 1 else [axs]), panels):
+    return {
+        'nrows': 1,
+        'ncols': len(panels),
+        'figsize': (width, 6),
+        'layout': 'constrained',
+    }
+
+
+def plot_stream(stream: eprem.Observer, user: dict, fig) -> None:
+    """Draw the survey panels for this stream on `fig`."""
+    panels = user.get('quantities') or ()
+    for ax, k in zip(fig.axes, panels):
         PANELS[k]['plotter'](stream, user, axes=ax)
     title = plots.make_title(stream, user, ['location', 'species'])
     fig.suptitle(title, fontsize=20)
@@ -125,6 +123,12 @@ if __name__ == '__main__':
         '--energy-unit',
         help="metric unit in which to display energies",
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        help="number of streams to plot in parallel (default: 1)",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         '-v', '--verbose',
         help="print runtime messages",
@@ -135,5 +139,13 @@ if __name__ == '__main__':
         help="display the plot on the screen",
         action='store_true',
     )
+    parser.add_argument(
+        '--simplify-threshold',
+        help=(
+            "maximum pixel deviation when simplifying plotted lines"
+            "; smaller values keep more detail (default: 1.0)"
+        ),
+        type=float,
+    )
     args = parser.parse_args()
     main(**vars(args))
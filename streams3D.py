@@ -3,6 +3,7 @@ import argparse
 import pathlib
 from collections import Counter
 import datetime
+import functools
 from types import SimpleNamespace
 import typing
 import sys
@@ -81,7 +82,7 @@ class Stream(PanelElement):
     def _get_interface(self, __id, args):
         """Create or return a valid stream-observer interface."""
         if len(args) == 2:
-            return eprem.stream(__id, *args)
+            return load_stream(__id, *args)
         if len(args) == 1:
             arg = args[0]
             if isinstance(arg, eprem.Stream):
@@ -761,6 +762,29 @@ class Figure:
             self.fig.write_image(str(figpath), **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
+def load_dataset(
+    source: typing.Optional[paths.PathLike]=None,
+    config: typing.Optional[paths.PathLike]=None,
+) -> eprem.Dataset:
+    """Load an EPREM dataset, reusing it if already loaded."""
+    return eprem.dataset(source=source, config=config)
+
+
+@functools.lru_cache(maxsize=None)
+def load_stream(
+    __id: int,
+    config: typing.Optional[paths.PathLike]=None,
+    source: typing.Optional[paths.PathLike]=None,
+) -> eprem.Stream:
+    """Load a stream observer, reusing it if already loaded.
+
+    Background and foreground streams frequently refer to the same stream
+    observers, so caching avoids opening each data file more than once.
+    """
+    return eprem.stream(__id, config, source)
+
+
 def single_panel_figure(**user):
     """Currently just an alias for ``main()``."""
     main(**user)
@@ -865,7 +889,7 @@ def create_background_streams(cli: dict):
     time_step = cli.get('time_step')
     distance_unit = cli.get('axis_unit')
     marker = build_marker(cli, 'background')
-    dataset = eprem.dataset(source=source, config=config)
+    dataset = load_dataset(source=source, config=config)
     nstreams = len(dataset.streams)
     ids = parse_stream_ids(cli.get('stream_ids'), nstreams)
     return [
@@ -886,7 +910,7 @@ def create_foreground_streams(cli: dict):
     config = cli.get('config')
     time_step = cli.get('time_step')
     distance_unit = cli.get('axis_unit')
-    dataset = eprem.dataset(source=source, config=config)
+    dataset = load_dataset(source=source, config=config)
     nstreams = len(dataset.streams)
     observers = cli.get('observer_ids') or cli.get('stream_ids')
     ids = parse_stream_ids(observers, nstreams)
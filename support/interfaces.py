@@ -3,6 +3,8 @@ Command-line support for EPREM analysis programs.
 """
 
 import argparse
+import concurrent.futures
+import functools
 import pathlib
 import textwrap
 import typing
@@ -119,17 +121,88 @@ def build_paths(
 
 
 
+OBSERVERS = {
+    'stream': eprem.stream,
+    'point': eprem.point,
+}
+"""Functions that load a single observer of each kind."""
+
+
+def get_observers(
+    kind: str,
+    source: typing.Optional[str]=None,
+    config: typing.Optional[str]=None,
+    num: typing.Optional[typing.Union[int, str]]=None,
+) -> typing.Iterable[eprem.Observer]:
+    """Get all relevant observers of the given kind ('stream' or 'point')."""
+    if num is not None:
+        return [OBSERVERS[kind](num, config=config, source=source)]
+    dataset = eprem.dataset(source=source, config=config)
+    return getattr(dataset, f'{kind}s').values()
+
+
 def get_streams(
     source: typing.Optional[str]=None,
     config: typing.Optional[str]=None,
     num: typing.Optional[int]=None,
-) -> typing.List[eprem.Stream]:
+) -> typing.Iterable[eprem.Stream]:
     """Get all relevant stream observers."""
+    return get_observers('stream', source, config, num)
+
+
+def get_observer_ids(
+    kind: str,
+    source: typing.Optional[str]=None,
+    config: typing.Optional[str]=None,
+    num: typing.Optional[typing.Union[int, str]]=None,
+) -> typing.List[typing.Union[int, str]]:
+    """Get the identifiers of all relevant observers of the given kind."""
+    if num is not None:
+        return [num]
     dataset = eprem.dataset(source=source, config=config)
-    streams = dataset.streams
-    if isinstance(num, int):
-        return [streams[num]]
-    return list(streams.values())
+    return list(getattr(dataset, f'{kind}s'))
+
+
+def map_observers(
+    worker: typing.Callable[..., typing.Any],
+    jobs: int,
+    kind: str,
+    source: typing.Optional[str]=None,
+    config: typing.Optional[str]=None,
+    num: typing.Optional[typing.Union[int, str]]=None,
+    *args,
+) -> typing.Iterator[typing.Any]:
+    """Apply `worker` to relevant observers in parallel processes.
+
+    This function calls ``worker(i, source, config, *args)`` for each relevant
+    observer ID, `i`, in a pool of `jobs` processes, and yields each result as
+    soon as it is available. Workers receive observer IDs rather than observers
+    so that each process opens its own dataset; `worker` and `args` must
+    therefore be picklable.
+    """
+    ids = get_observer_ids(kind, source, config, num)
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        futures = [
+            executor.submit(worker, i, source, config, *args)
+            for i in ids
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def set_backend(show: bool=False, rc: typing.Optional[dict]=None) -> None:
+    """Prepare matplotlib for interactive or batch plotting.
+
+    This function selects the non-interactive Agg backend unless the user
+    intends to display plots on the screen, then applies any runtime
+    configuration in `rc`. Programs should call it before creating any figures;
+    it is safe to call after importing `matplotlib.pyplot`, which switches to
+    the selected backend.
+    """
+    import matplotlib
+    if not show:
+        matplotlib.use('Agg')
+    matplotlib.rcParams.update(rc or {})
 
 
 def get_time(user: dict):
@@ -158,6 +231,17 @@ def compute_indexer(args: typing.Union[typing.Sequence, None]):
     """Get appropriate indices or values from user input."""
     if args is None:
         return (0,)
+    return _compute_indexer(tuple(args))
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_indexer(args: typing.Tuple[str, ...]):
+    """Memoized implementation of `compute_indexer`.
+
+    Plotting routines parse the same user input once per stream or panel, and
+    building a measurement from a unit string is relatively expensive, so this
+    function caches results by the (hashable) tuple of arguments.
+    """
     if len(args) == 1:
         return (int(args[0]),)
     try:
@@ -301,6 +385,20 @@ common.add_argument(
     type=float,
     metavar=('LO', 'HI'),
 )
+common.add_argument(
+    '--simplify-threshold',
+    help=(
+        "maximum pixel deviation when simplifying plotted lines"
+        "; smaller values keep more detail (default: 1.0)"
+    ),
+    type=float,
+)
+common.add_argument(
+    '-j', '--jobs',
+    help="number of streams to plot in parallel (default: 1)",
+    type=int,
+    default=1,
+)
 common.add_argument(
     '-v', '--verbose',
     help="print runtime messages",
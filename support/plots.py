@@ -1,18 +1,163 @@
+import functools
+import hashlib
 import math
+import os
+import pathlib
+import tempfile
 import typing
+import zipfile
 
 import numpy
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 from eprempy import Observable
 from eprempy import eprem
 from eprempy import measured
 from eprempy import quantity
+from eprempy.paths import fullpath
 from . import interfaces
 
 
+SAVEFIG_KWS = {
+    'dpi': 100,
+    'metadata': {'Software': None},
+    'pil_kwargs': {'compress_level': 1},
+}
+"""Keyword arguments for saving survey plots as PNG files.
+
+A low compression level makes PNG encoding several times faster in exchange
+for slightly larger files, which is a good trade for batches of line plots.
+"""
+
+
+RCPARAMS = {
+    'agg.path.chunksize': 10000,
+    'path.simplify_threshold': 1.0,
+}
+"""Runtime matplotlib configuration for plots of long series.
+
+Agg renders very long paths in chunks instead of failing, and path
+simplification (on by default in matplotlib) may drop vertices that deviate by
+up to a pixel from a straight segment, which is invisible in these plots but
+greatly reduces drawing time. See `get_rcparams` for user overrides.
+"""
+
+
+def get_rcparams(user: dict) -> dict:
+    """Get runtime matplotlib configuration, including user overrides."""
+    rc = RCPARAMS.copy()
+    threshold = user.get('simplify_threshold')
+    if threshold is not None:
+        rc['path.simplify_threshold'] = threshold
+    return rc
+
+
+def reuse_figure(
+    fig: typing.Optional[Figure]=None,
+    clear: bool=True,
+    **kwargs
+) -> Figure:
+    """Get a figure for the next plot in a series.
+
+    If pyplot still manages `fig` (e.g., because the user has not closed its
+    window), this function will clear each of its axes, unless `clear` is
+    false, and return it. Otherwise, it will create a new figure and axes from
+    `kwargs`, which may include any argument to `pyplot.subplots`. Reusing axes
+    in place avoids re-creating the figure, its canvas, and its axes for every
+    plot in a series.
+    """
+    if fig is not None and plt.fignum_exists(fig.number):
+        if clear:
+            for ax in fig.axes:
+                ax.cla()
+        return fig
+    fig, _ = plt.subplots(**kwargs)
+    return fig
+
+
+def save_observers(
+    draw: typing.Callable[[eprem.Observer, dict, Figure], None],
+    user: dict,
+    kind: str='stream',
+    num: typing.Optional[typing.Union[int, str]]=None,
+    source: typing.Optional[str]=None,
+    config: typing.Optional[str]=None,
+    outdir: typing.Optional[str]=None,
+    verbose: bool=False,
+    jobs: int=1,
+    plotname: str='{stem}.png',
+    subplots: typing.Optional[dict]=None,
+    rc: typing.Optional[dict]=None,
+    clear: bool=True,
+) -> None:
+    """Draw and save a plot for each relevant observer of the given kind.
+
+    This function calls ``draw(observer, user, fig)`` for each observer, then
+    saves `fig` to `plotname`, formatted with the stem of the observer's data
+    file, in `outdir`. It creates figures by passing `subplots` to
+    `pyplot.subplots` and applies `rc` via `interfaces.set_backend`.
+
+    A serial run draws every observer on the same figure (cf. `reuse_figure`);
+    passing ``clear=False`` keeps existing artists so that `draw` may update
+    their data. If `jobs` is greater than 1 and the user did not request
+    interactive display, this function instead plots observers in a pool of
+    worker processes (cf. `interfaces.map_observers`). Each task loads its own
+    observer and draws on a new figure, so that workers share neither open files
+    nor figures; `draw` and `user` must therefore be picklable.
+    """
+    show = user.get('show')
+    interfaces.set_backend(show, rc)
+    plotdir = fullpath(outdir or source or '.')
+    plotdir.mkdir(parents=True, exist_ok=True)
+    subplots = subplots or {}
+    if jobs > 1 and not show:
+        args = (kind, draw, plotname, plotdir, subplots, rc, user)
+        results = interfaces.map_observers(
+            _save_observer, jobs, kind, source, config, num, *args
+        )
+        for plotpath in results:
+            if verbose:
+                print(f"Saved {plotpath}")
+        return
+    fig = None
+    for observer in interfaces.get_observers(kind, source, config, num):
+        fig = reuse_figure(fig, clear=clear, **subplots)
+        draw(observer, user, fig)
+        plotpath = plotdir / plotname.format(stem=observer.source.stem)
+        if verbose:
+            print(f"Saved {plotpath}")
+        fig.savefig(plotpath, **SAVEFIG_KWS)
+        if show:
+            plt.show()
+    plt.close(fig)
+
+
+def _save_observer(
+    num: typing.Union[int, str],
+    source: typing.Optional[str],
+    config: typing.Optional[str],
+    kind: str,
+    draw: typing.Callable[[eprem.Observer, dict, Figure], None],
+    plotname: str,
+    plotdir: pathlib.Path,
+    subplots: dict,
+    rc: typing.Optional[dict],
+    user: dict,
+) -> pathlib.Path:
+    """Plot and save a single observer in a worker process."""
+    interfaces.set_backend(rc=rc)
+    observer, = interfaces.get_observers(kind, source, config, num)
+    fig, _ = plt.subplots(**subplots)
+    draw(observer, user, fig)
+    plotpath = plotdir / plotname.format(stem=observer.source.stem)
+    fig.savefig(plotpath, **SAVEFIG_KWS)
+    plt.close(fig)
+    return plotpath
+
+
 def flux_time(
     stream: eprem.Observer,
     user: dict,
@@ -22,19 +167,21 @@ def flux_time(
     location = interfaces.get_location(user)
     species = interfaces.get_species(user)
     units = interfaces.get_units(user)
+    flux = stream['flux'].withunit(units['flux'])
+    times = stream.times.withunit(units['time'])
     if user.get('energies'):
         energies = quantity.measure(*user['energies'])
+        arrays = flux[:, location, species, energies].squeezed
     else:
         energies = stream.energies.withunit(units['energy'])
-    flux = stream['flux'].withunit(units['flux'])
-    times = stream.times.withunit(units['time'])
-    cmap = mpl.colormaps['jet']
-    colors = cmap(numpy.linspace(0, 1, len(energies)))
+        arrays = flux[:, location, species, :].squeezed
+    arrays = numpy.reshape(arrays, (len(times), len(energies)))
+    xvalues = numpy.array(times)
+    colors = jet_colors(len(energies))
     ax = axes or plt.gca()
     for i, energy in enumerate(energies):
-        array = flux[:, location, species, energy].squeezed
         label = f"{float(energy):.3f} {energies.unit}"
-        ax.plot(times, array, label=label, color=colors[i])
+        ax.plot(xvalues, arrays[:, i], label=label, color=colors[i])
     if user.get('ylim'):
         ax.set_ylim(user['ylim'])
     ax.set_xlabel(f"Time [{times.unit}]", fontsize=14)
@@ -61,37 +208,35 @@ def flux_energy(
     units = interfaces.get_units(user)
     flux = stream['flux'].withunit(units['flux'])
     energies = stream.energies.withunit(units['energy'])
+    xvalues = numpy.array(energies)
     ax = axes or plt.gca()
-    cmap = mpl.colormaps['jet']
-    colors = cmap(numpy.linspace(0, 1, len(times)))
     legend = False
     if len(times) > 1 and len(locations) > 1:
         raise ValueError
     elif len(times) == 1 and len(locations) > 1:
-        colors = cmap(numpy.linspace(0, 1, len(locations)))
-        for i, location in enumerate(locations):
-            array = flux[times[0], location, species, :].squeezed
-            if isinstance(locations, measured.Object):
-                label = f"r = {float(location):.3f} {locations.unit}"
-            else:
-                label = f"shell = {int(location)}"
-            ax.plot(energies, array, label=label, color=colors[i])
+        arrays = flux[times[0], locations, species, :].squeezed
+        if isinstance(locations, measured.Object):
+            labels = [
+                f"r = {float(location):.3f} {locations.unit}"
+                for location in locations
+            ]
+        else:
+            labels = [f"shell = {int(location)}" for location in locations]
+        plot_lines(ax, xvalues, arrays, labels)
         ax.set_title(make_title(stream, user, ['time', 'species']))
         legend = True
     elif len(times) > 1 and len(locations) == 1:
-        colors = cmap(numpy.linspace(0, 1, len(times)))
-        for i, time in enumerate(times):
-            array = flux[time, locations[0], species, :].squeezed
-            if isinstance(times, measured.Object):
-                label = f"t = {float(time):.1f} {times.unit}"
-            else:
-                label = f"time step {int(time)}"
-            ax.plot(energies, array, label=label, color=colors[i])
+        arrays = flux[times, locations[0], species, :].squeezed
+        if isinstance(times, measured.Object):
+            labels = [f"t = {float(time):.1f} {times.unit}" for time in times]
+        else:
+            labels = [f"time step {int(time)}" for time in times]
+        plot_lines(ax, xvalues, arrays, labels)
         ax.set_title(make_title(stream, user, ['location', 'species']))
         legend = True
     else:
         array = flux[times[0], locations[0], species, :].squeezed
-        ax.plot(energies, array)
+        ax.plot(xvalues, array)
         ax.set_title(make_title(stream, user, ['time', 'location', 'species']))
     if user.get('ylim'):
         ax.set_ylim(user['ylim'])
@@ -120,7 +265,7 @@ def fluence_energy(
     energies = stream.energies.withunit(units['energy'])
     array = fluence[-1, location, species, :].squeezed
     ax = axes or plt.gca()
-    ax.plot(energies, array)
+    ax.plot(numpy.array(energies), array)
     if user.get('ylim'):
         ax.set_ylim(user['ylim'])
     ax.set_xlabel(f"Energy [{energies.unit}]", fontsize=14)
@@ -133,8 +278,14 @@ def intflux_time(
     stream: eprem.Observer,
     user: dict,
     axes: typing.Optional[Axes]=None,
+    cachedir: typing.Optional[pathlib.Path]=None,
 ) -> None:
-    """Create a plot of integral flux versus time for this stream."""
+    """Create a plot of integral flux versus time for this stream.
+
+    If `cachedir` is not None, this function will load the integral-flux array
+    from a file in that directory, if available, or save it there after reading
+    it from the dataset.
+    """
     location = interfaces.get_location(user)
     species = interfaces.get_species(user)
     units = interfaces.get_units(user)
@@ -144,11 +295,26 @@ def intflux_time(
     else:
         energies = quantity.measure(10.0, 50.0, 100.0, units['energy'])
     times = stream.times.withunit(units['time'])
+    key = (
+        'integral flux',
+        str(location),
+        str(species),
+        str(intflux.unit),
+        *(float(energy) for energy in energies),
+        str(energies.unit),
+    )
+    arrays = load_cached(
+        stream,
+        key,
+        lambda: intflux[:, location, species, energies].squeezed,
+        cachedir,
+    )
+    arrays = numpy.reshape(arrays, (len(times), len(energies)))
+    xvalues = numpy.array(times)
     ax = axes or plt.gca()
-    for energy in energies:
-        array = intflux[:, location, species, energy].squeezed
+    for i, energy in enumerate(energies):
         label = fr"$\geq${float(energy)} {energies.unit}"
-        ax.plot(times, array, label=label)
+        ax.plot(xvalues, arrays[:, i], label=label)
     if user.get('ylim'):
         ax.set_ylim(user['ylim'])
     ax.set_xlabel(f"Time [{times.unit}]", fontsize=14)
@@ -158,9 +324,75 @@ def intflux_time(
     ax.legend(loc='center left', bbox_to_anchor=(1.0, 0.5), handlelength=1.0)
 
 
+def load_cached(
+    stream: eprem.Observer,
+    key: tuple,
+    compute: typing.Callable[[], numpy.ndarray],
+    cachedir: typing.Optional[pathlib.Path]=None,
+) -> numpy.ndarray:
+    """Compute an array for this stream or load it from an on-disk cache.
+
+    This function names each cache file after a hash of `key` together with the
+    path, size, and modification time of the stream's data file, so that
+    changing either the request or the data invalidates the cached array. It
+    treats an unreadable cache file as a miss, and writes each new file under a
+    temporary name before moving it into place, so that concurrent or
+    interrupted runs never leave a partial file behind. It simply calls
+    `compute` when `cachedir` is None.
+    """
+    if cachedir is None:
+        return compute()
+    stat = stream.source.stat()
+    parts = (str(stream.source), stat.st_size, stat.st_mtime_ns, *key)
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    path = pathlib.Path(cachedir) / f"{digest}.npz"
+    try:
+        with numpy.load(path) as data:
+            return data['array']
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        pass
+    array = compute()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent,
+        suffix='.npz',
+        delete=False,
+    ) as fp:
+        numpy.savez_compressed(fp, array=array)
+    os.replace(fp.name, path)
+    return array
+
+
+def plot_lines(
+    ax: Axes,
+    x: numpy.ndarray,
+    arrays: numpy.ndarray,
+    labels: typing.Sequence[str],
+) -> None:
+    """Plot each row of `arrays` against `x` with a single call.
+
+    This function colors lines by sampling the 'jet' colormap at evenly spaced
+    points, in the order given by `labels`.
+    """
+    colors = jet_colors(len(labels))
+    lines = ax.plot(x, numpy.transpose(arrays))
+    for line, label, color in zip(lines, labels, colors):
+        line.set(label=label, color=color)
+
+
+@functools.lru_cache(maxsize=32)
+def jet_colors(n: int) -> numpy.ndarray:
+    """Sample `n` evenly spaced RGBA colors from the 'jet' colormap.
+
+    Successive plots usually have the same number of lines, so this function
+    caches its result by `n`. Callers should not modify the returned array.
+    """
+    return mpl.colormaps['jet'](numpy.linspace(0, 1, n))
+
+
 def compute_yloglim(maxval):
     """Compute logarithmic y-axis limits based on `maxval`."""
-    ylogmax = int(numpy.log10(maxval)) + 1
+    ylogmax = int(math.log10(maxval)) + 1
     return 10**(ylogmax-6), 10**ylogmax
 
 
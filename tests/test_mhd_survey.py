@@ -0,0 +1,136 @@
+import importlib.util
+import pathlib
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy
+import pytest
+
+ROOT = pathlib.Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from support import interfaces
+
+# Load the script as a named module so that worker processes can unpickle its
+# functions by reference.
+_spec = importlib.util.spec_from_file_location(
+    'mhd_survey',
+    ROOT / 'mhd-survey.py',
+)
+mhd = importlib.util.module_from_spec(_spec)
+sys.modules['mhd_survey'] = mhd
+_spec.loader.exec_module(mhd)
+
+NT, NS = 40, 30
+NAMES = (
+    'Br', 'Btheta', 'Bphi',
+    'Ur', 'Utheta', 'Uphi',
+    'rho',
+)
+
+
+class Array:
+    """A minimal stand-in for an eprempy observable or measurement."""
+
+    def __init__(self, array: numpy.ndarray) -> None:
+        self.array = array
+
+    def withunit(self, unit):
+        return self
+
+    def __getitem__(self, indices):
+        return Array(self.array[indices])
+
+    def __array__(self, *args, **kwargs):
+        return numpy.asarray(self.array, *args, **kwargs)
+
+    def __len__(self):
+        return len(self.array)
+
+    @property
+    def squeezed(self):
+        return numpy.squeeze(self.array)
+
+
+class Stream:
+    """A minimal stand-in for an eprempy stream observer."""
+
+    def __init__(self, seed: int) -> None:
+        rng = numpy.random.default_rng(seed)
+        self.source = pathlib.Path(f'obs{seed:06}.nc')
+        self.times = Array(numpy.linspace(0.0, 48.0, NT))
+        radii = numpy.linspace(0.05, 1.5, NS)[None, :]
+        self.data = {name: rng.random((NT, NS)) for name in NAMES}
+        self.data['radius'] = radii * numpy.linspace(0.5, 1.0, NT)[:, None]
+
+    def __getitem__(self, name: str):
+        return Array(self.data[name])
+
+
+def expected_rows(stream: Stream, name: str, user: dict):
+    """Compute the (x, y) data of each line for `name`, in plotting order."""
+    if user['time'] is None:
+        return [
+            (numpy.array(stream.times), stream.data[name][:, int(i)])
+            for i in user['location']
+        ]
+    return [
+        (stream.data['radius'][int(i), :], stream.data[name][int(i), :])
+        for i in user['time']
+    ]
+
+
+@pytest.mark.parametrize(
+    'user',
+    [
+        {'location': ['3', '5'], 'time': None},
+        {'location': None, 'time': ['2', '4']},
+        {'location': ['3'], 'time': None},
+        {'location': None, 'time': ['3']},
+    ],
+)
+def test_plot_stream(user: dict):
+    """Each quantity gets one line per value of the multi-valued parameter."""
+    user = {'xlim': None, 'ylog': None, **user}
+    fig, _ = plt.subplots(nrows=3, ncols=1, sharex=True)
+    for stream in (Stream(0), Stream(1)):
+        mhd.plot_stream(stream, user, fig)
+        for ax, key in zip(fig.axes, mhd.SUBSETS):
+            names = mhd.get_quantities(key)
+            lines = ax.get_lines()
+            assert len(lines) == len(names) * mhd.count_values(user)
+            rows = [
+                row for name in names
+                for row in expected_rows(stream, name, user)
+            ]
+            for line, (x, y) in zip(lines, rows):
+                assert numpy.array_equal(line.get_xdata(), x)
+                assert numpy.array_equal(line.get_ydata(), y)
+    plt.close(fig)
+
+
+def test_main_parallel(tmp_path: pathlib.Path, monkeypatch):
+    """Parallel runs save the same multi-valued survey plots as serial runs."""
+    streams = {i: Stream(i) for i in range(3)}
+    monkeypatch.setattr(
+        interfaces,
+        'get_observers',
+        lambda kind, source, config, num: (
+            [streams[num]] if num is not None else list(streams.values())
+        ),
+    )
+    monkeypatch.setattr(
+        interfaces,
+        'get_observer_ids',
+        lambda kind, source, config, num: list(streams),
+    )
+    user = {'location': ['3', '5'], 'time': None, 'xlim': None, 'ylog': None}
+    mhd.main(outdir=str(tmp_path / 'serial'), jobs=1, **user)
+    mhd.main(outdir=str(tmp_path / 'parallel'), jobs=2, **user)
+    for stream in streams.values():
+        name = f"mhd-{stream.source.stem}.png"
+        serial = plt.imread(tmp_path / 'serial' / name)
+        parallel = plt.imread(tmp_path / 'parallel' / name)
+        assert numpy.array_equal(parallel, serial)